@@ -14,9 +14,6 @@ import datetime
 
 from va_tool import __version__
 from va_tool.utils import setup_logging, get_logger, DEFAULT_OUTPUT_DIR
-from va_tool.data import load_vulnerability_file, load_kev_file
-from va_tool.processing import process_vulnerability_data
-from va_tool.reporting import ReportEngine
 
 
 def parse_arguments():
@@ -135,6 +132,13 @@ def main():
     logger.info(f"Using KEV data from {kev_file}")
     logger.info(f"Results will be saved to {output_dir}")
     
+    # Import the data, processing and reporting packages only once the inputs
+    # are validated; they pull in pandas, openpyxl and matplotlib, which would
+    # otherwise slow down --help, --version and early argument errors.
+    from va_tool.data import load_vulnerability_file, load_kev_file
+    from va_tool.processing import process_vulnerability_data
+    from va_tool.reporting import ReportEngine
+    
     # Load input data
     vuln_df = load_vulnerability_file(vuln_file)
     if vuln_df is None: